@@ -8,7 +8,9 @@ from uevf.config import load_modeling_config
 from uevf.elcc import compute_baseline_elcc, apply_penetration_decay
 from uevf.survival import compute_survival_entropy
 from uevf.ascde import compute_ascde
-from uevf.utils import load_csv, save_dataframe
+from uevf.utils import load_csv, load_table, save_dataframe
+from uevf.validation import validate_inputs, stage_requirements
+from uevf.service import serve
 import logging
 import sys
 import json
@@ -38,6 +40,14 @@ def main():
                         help="Path to penetration ratios JSON")
     parser.add_argument("--data-dir", "-d",
                         help="Base directory for all data inputs; overrides individual file paths")
+    parser.add_argument("--skip-validation", action="store_true",
+                        help="Skip the pre-flight header-and-sample input validation")
+    parser.add_argument("--serve", action="store_true",
+                        help="Run a warm localhost scoring service instead of the batch pipeline")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="Interface for --serve to bind")
+    parser.add_argument("--port", type=int, default=8765,
+                        help="Port for --serve to listen on")
     args = parser.parse_args()
 
     # If a single data directory is specified, derive all input paths from it
@@ -50,27 +60,55 @@ def main():
         args.queue = os.path.join(base, "July Queue's 2025.xlsx")
         args.eue = os.path.join(base, "UEVF-IQ - Foundational.csv")
 
-    # Load unified config and penetration ratios
-    cfg = load_modeling_config(args.config)
-    with open(args.penetration, 'r') as f:
-        penetration = json.load(f)
-
     # Verify that all required input files exist
     required_files = [
         args.config, args.penetration,
         args.resources, args.netload,
-        args.queue, args.eue
+        args.eue
     ]
+    # The scoring service never reads the queue workbook
+    if not args.serve:
+        required_files.append(args.queue)
     for file_path in required_files:
         if not os.path.exists(file_path):
             logging.error("Required input file not found: %s", file_path)
             sys.exit(1)
 
+    # Cheap pre-flight gate on the inputs the selected stage(s) read; --serve
+    # validates its own inputs when loading state
+    if not args.skip_validation and not args.serve:
+        stages = ["elcc", "survival", "ascde"] if args.pipeline == "full" else [args.pipeline]
+        required = stage_requirements(stages)
+        report = validate_inputs({name: getattr(args, name) for name in required},
+                                 columns=required)
+        for name, entry in report["inputs"].items():
+            for msg in entry["errors"]:
+                logging.error("Input validation (%s): %s", name, msg)
+            for msg in entry["warnings"]:
+                logging.warning("Input validation (%s): %s", name, msg)
+        for msg in report["warnings"]:
+            logging.warning("Input validation: %s", msg)
+        if not report["ok"]:
+            sys.exit(1)
+
+    if args.serve:
+        serve({
+            "config": args.config, "penetration": args.penetration,
+            "resources": args.resources, "netload": args.netload,
+            "eue": args.eue,
+        }, host=args.host, port=args.port, validate=not args.skip_validation)
+        sys.exit(0)
+
+    # Load unified config and penetration ratios
+    cfg = load_modeling_config(args.config)
+    with open(args.penetration, 'r') as f:
+        penetration = json.load(f)
+
     if args.pipeline in ("elcc", "full"):
         try:
             logging.info("Starting ELCC calculation...")
-            res_df = load_csv(args.resources, parse_dates=["Timestamp"])
-            nl_df = load_csv(args.netload, parse_dates=["Timestamp"])
+            res_df = load_table(args.resources, parse_dates=["Timestamp"])
+            nl_df = load_table(args.netload, parse_dates=["Timestamp"])
             elcc_df = compute_baseline_elcc(res_df, nl_df, cfg["modeling_parameters"]["peak_percentile"])
             elcc_df = apply_penetration_decay(elcc_df, penetration, cfg["elcc_decay_parameters"])
             save_dataframe(elcc_df, "outputs/elcc_summary.csv")
@@ -82,7 +120,7 @@ def main():
     if args.pipeline in ("survival", "full"):
         try:
             logging.info("Starting survival entropy calculation...")
-            queue_df = load_csv(args.queue, parse_dates=["QueueDate", "CODDate"])
+            queue_df = load_table(args.queue, parse_dates=["QueueDate", "CODDate"])
             queue_df["SurvivalTime"] = (queue_df["CODDate"] - queue_df["QueueDate"]).dt.days
             queue_df["Event"] = queue_df["Status"].apply(lambda x: 1 if x == "Operational" else 0)
             entropy_df = compute_survival_entropy(queue_df)
@@ -95,9 +133,9 @@ def main():
     if args.pipeline in ("ascde", "full"):
         try:
             logging.info("Starting ASCDE calculation...")
-            queue_df = load_csv(args.queue)
+            queue_df = load_table(args.queue)
             elcc_df = load_csv("outputs/elcc_summary.csv")
-            eue_df = load_csv(args.eue)
+            eue_df = load_table(args.eue)
             ascde_df = compute_ascde(queue_df, elcc_df, eue_df, cfg["modeling_parameters"]["voll"])
             save_dataframe(ascde_df, "outputs/ascde_scores.csv")
             logging.info("ASCDE step complete: outputs/ascde_scores.csv")
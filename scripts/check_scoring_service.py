@@ -0,0 +1,157 @@
+"""
+Smoke check for the warm scoring service (uevf/service.py).
+
+Builds small synthetic inputs (net load as .xlsx), starts the service on a free
+localhost port and checks concurrent /score batching, isolation of a bad request,
+per-project EUE, string ProjectIDs, warnings for null scores, /whatif input checks
+and hot reload (with partial rebuilds) after an input file changes.
+Exits non-zero on the first failed check.
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+# Allow running as `python scripts/check_scoring_service.py` without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from uevf.service import make_server
+
+VOLL = 1000.0
+
+def write_inputs(base):
+    ts = pd.date_range("2023-01-01", periods=48, freq="h")
+    pd.DataFrame({"Timestamp": list(ts) * 2, "ISO": ["A"] * 48 + ["B"] * 48,
+                  "TechType": "Solar", "CapacityFactor": 0.3}).to_csv(
+        os.path.join(base, "resources.csv"), index=False)
+    pd.DataFrame({"Timestamp": list(ts) * 2, "ISO": ["A"] * 48 + ["B"] * 48,
+                  "NetLoad": range(96)}).to_excel(os.path.join(base, "netload.xlsx"), index=False)
+    pd.DataFrame({"ProjectID": [1, 2], "EUE": [1.0, 2.0]}).to_csv(
+        os.path.join(base, "eue.csv"), index=False)
+    write_config(base, VOLL)
+    with open(os.path.join(base, "penetration.json"), "w") as f:
+        json.dump({"A": {"Solar": 0.2}}, f)
+    return {
+        "config": os.path.join(base, "config.json"),
+        "penetration": os.path.join(base, "penetration.json"),
+        "resources": os.path.join(base, "resources.csv"),
+        "netload": os.path.join(base, "netload.xlsx"),
+        "eue": os.path.join(base, "eue.csv"),
+    }
+
+def write_config(base, voll):
+    with open(os.path.join(base, "config.json"), "w") as f:
+        json.dump({"modeling_parameters": {"peak_percentile": 0.9, "voll": voll},
+                   "elcc_decay_parameters": {"Solar": 0.5}}, f)
+
+def post(url, body):
+    req = urllib.request.Request(url, data=json.dumps(body).encode(), method="POST")
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, json.load(resp)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+def touch(path):
+    mtime = os.path.getmtime(path) + 5
+    os.utime(path, (mtime, mtime))
+
+def wait_for_reload(server, state, timeout=10):
+    deadline = time.time() + timeout
+    while server.service.state is state and time.time() < deadline:
+        time.sleep(0.1)
+
+def check(condition, message):
+    if not condition:
+        print(f"❌ {message}")
+        sys.exit(1)
+    print(f"✅ {message}")
+
+def main():
+    logging.basicConfig(level=logging.WARNING)
+    with tempfile.TemporaryDirectory() as base:
+        paths = write_inputs(base)
+        server = make_server(paths, port=0, reload_interval=0.2)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = "http://%s:%d" % server.server_address[:2]
+        elcc = {row["ISO"]: row["AdjustedELCC"] for row in server.service.state.elcc.to_dict("records")}
+
+        # Concurrent score requests, one of them malformed
+        good = {"projects": [{"ProjectID": 1, "ISO": "A", "TechType": "Solar", "Capacity": 100}]}
+        bad = {"projects": [{"ProjectID": 2, "ISO": "B", "TechType": "Solar", "Capacity": "abc"}]}
+        bodies = [good] * 15 + [bad] + [good] * 4
+        results = [None] * len(bodies)
+
+        def call(i):
+            results[i] = post(url + "/score", bodies[i])
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(len(bodies))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        expected = 1.0 * VOLL / (100 * elcc["A"])
+        good_results = [r for i, r in enumerate(results) if bodies[i] is good]
+        check(all(status == 200 and len(body["scores"]) == 1
+                  and abs(body["scores"][0]["ASCDE"] - expected) < 1e-9
+                  for status, body in good_results),
+              "concurrent /score requests each get their own correct scores")
+        check(results[15][0] == 400, "malformed Capacity fails only its own request (400)")
+
+        # Per-project EUE overrides the table; unknown projects are flagged
+        status, body = post(url + "/score", {"projects": [
+            {"ProjectID": 1, "ISO": "A", "TechType": "Solar", "Capacity": 100, "EUE": 5.0},
+            {"ProjectID": 99, "ISO": "A", "TechType": "Solar", "Capacity": 100},
+        ]})
+        check(status == 200 and body["scores"][0]["EUE"] == 5.0
+              and body["scores"][1]["ASCDE"] is None and body["warnings"],
+              "request EUE takes precedence and missing EUE is reported")
+
+        status, body = post(url + "/score", {"projects": [
+            {"ProjectID": "1", "ISO": "A", "TechType": "Solar", "Capacity": 100}]})
+        check(status == 200 and abs(body["scores"][0]["ASCDE"] - expected) < 1e-9,
+              "string ProjectIDs match the EUE table")
+
+        status, body = post(url + "/score", {"projects": [
+            {"ProjectID": 1, "ISO": "A", "TechType": "Solar", "Capacity": 0}]})
+        check(status == 200 and body["scores"][0]["ASCDE"] is None
+              and any("not finite" in w for w in body["warnings"]),
+              "zero Capacity yields a null score with a warning")
+
+        for penetration in ([1], {"A": {"Solar": True}}):
+            status, _ = post(url + "/whatif", {"penetration": penetration})
+            check(status == 400, f"malformed /whatif penetration {penetration} is rejected (400)")
+
+        # Hot reload after the config file changes: VOLL updates, baseline ELCC is reused
+        state = server.service.state
+        write_config(base, 2 * VOLL)
+        touch(paths["config"])
+        wait_for_reload(server, state)
+        status, body = post(url + "/score", good)
+        check(status == 200 and abs(body["scores"][0]["ASCDE"] - 2 * expected) < 1e-9,
+              "state reloads after an input file's mtime changes")
+        check(server.service.state.baseline_elcc is state.baseline_elcc
+              and server.service.state.eue is state.eue,
+              "config-only reload reuses baseline ELCC and the EUE table")
+
+        # A net load change rebuilds baseline ELCC
+        state = server.service.state
+        touch(paths["netload"])
+        wait_for_reload(server, state)
+        check(server.service.state.baseline_elcc is not state.baseline_elcc
+              and server.service.state.eue is state.eue,
+              "net load reload rebuilds baseline ELCC only")
+
+        server.shutdown()
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Smoke check for the fast input validator (uevf/validation.py).
+
+Builds small synthetic inputs and checks chunked CSV and Excel range scans, the
+Excel process-pool path, a workbook with a wrong <dimension> tag, malformed config
+and penetration JSON, mixed timezone timestamps and stage-scoped column checks.
+Exits non-zero on the first failed check.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+
+# Allow running as `python scripts/check_validation.py` without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from uevf.validation import scan_columns, stage_requirements, validate_inputs
+
+def write_inputs(base):
+    ts = pd.date_range("2023-01-01", periods=48, freq="h")
+    pd.DataFrame({"Timestamp": list(ts) * 2, "ISO": ["A"] * 48 + ["B"] * 48,
+                  "TechType": "Solar", "CapacityFactor": 0.3}).to_csv(
+        os.path.join(base, "resources.csv"), index=False)
+    pd.DataFrame({"Timestamp": [t.tz_localize("UTC") for t in ts] * 2,
+                  "ISO": ["A"] * 48 + ["B"] * 48, "TechType": "Solar",
+                  "CapacityFactor": 0.3}).to_csv(os.path.join(base, "resources_utc.csv"), index=False)
+    pd.DataFrame({"Timestamp": list(ts) * 2, "ISO": ["A"] * 48 + ["C"] * 48,
+                  "NetLoad": range(96)}).to_excel(os.path.join(base, "netload.xlsx"), index=False)
+    # Queue lacks Capacity: fine for the survival stage, not for ASCDE
+    pd.DataFrame({"ProjectID": [1, 2], "ISO": ["A", "B"], "TechType": "Solar",
+                  "QueueDate": ["2020-01-01", "2021-01-01"], "CODDate": ["2022-01-01", None],
+                  "Status": ["Operational", "Active"]}).to_excel(
+        os.path.join(base, "queue.xlsx"), index=False)
+    pd.DataFrame({"ProjectID": [1, 2], "EUE": [1.0, 2.0]}).to_csv(
+        os.path.join(base, "eue.csv"), index=False)
+    write_json(base, "config.json", {"modeling_parameters": {"peak_percentile": 0.9, "voll": 1000},
+                                     "elcc_decay_parameters": {"Solar": 0.5}})
+    write_json(base, "penetration.json", {"A": {"Solar": 0.2}})
+    write_json(base, "bad_config.json", {"modeling_parameters": 5, "elcc_decay_parameters": []})
+    write_json(base, "bad_penetration.json", {"A": {"Solar": True}})
+    with open(os.path.join(base, "broken.json"), "w") as f:
+        f.write("{not json")
+
+def write_json(base, name, data):
+    with open(os.path.join(base, name), "w") as f:
+        json.dump(data, f)
+
+def write_bad_dimension(src, dst):
+    # Rewrite the sheet's <dimension> tag to A1, as some exporters do
+    with zipfile.ZipFile(src) as zin, zipfile.ZipFile(dst, "w") as zout:
+        for item in zin.infolist():
+            data = zin.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                text = data.decode()
+                start = text.index("<dimension ref=\"") + len("<dimension ref=\"")
+                text = text[:start] + "A1" + text[text.index("\"", start):]
+                data = text.encode()
+            zout.writestr(item, data)
+
+def check(condition, message):
+    if not condition:
+        print(f"❌ {message}")
+        sys.exit(1)
+    print(f"✅ {message}")
+
+def main():
+    base = tempfile.mkdtemp()
+    try:
+        write_inputs(base)
+        path = lambda name: os.path.join(base, name)
+        expected = (pd.Timestamp("2023-01-01 00:00"), pd.Timestamp("2023-01-02 23:00"))
+
+        ranges, isos, _ = scan_columns(path("resources.csv"), ["Timestamp"], chunksize=7)
+        check(ranges["Timestamp"] == expected and isos == ["A", "B"],
+              "chunked CSV scan gives full range and ISO coverage")
+        ranges, isos, _ = scan_columns(path("netload.xlsx"), ["Timestamp"], chunksize=7)
+        check(ranges["Timestamp"] == expected and isos == ["A", "C"],
+              "chunked Excel scan gives full range and ISO coverage")
+
+        write_bad_dimension(path("netload.xlsx"), path("netload_dim.xlsx"))
+        report = validate_inputs({"netload": path("netload_dim.xlsx")})
+        check(report["ok"] and report["inputs"]["netload"]["ranges"]["Timestamp"] == expected,
+              "workbook with a wrong <dimension> tag is scanned fully")
+
+        full = {"config": path("config.json"), "penetration": path("penetration.json"),
+                "resources": path("resources.csv"), "netload": path("netload.xlsx"),
+                "queue": path("queue.xlsx"), "eue": path("eue.csv")}
+        report = validate_inputs(full)
+        check(not report["ok"] and report["inputs"]["queue"]["errors"] == ["missing column: Capacity"]
+              and report["inputs"]["netload"]["ok"],
+              "two workbooks validate through the process pool")
+        threaded = validate_inputs(full, processes=False)
+        check(threaded["inputs"]["netload"] == report["inputs"]["netload"],
+              "threads-only mode gives the same report")
+        check(any("['C']" in w for w in report["warnings"]),
+              "uncovered net load ISOs are reported")
+
+        for stage, ok in (("elcc", True), ("survival", True), ("ascde", False)):
+            required = stage_requirements([stage])
+            report = validate_inputs({name: full[name] for name in required}, columns=required)
+            check(report["ok"] == ok, f"{stage} stage checks only the columns it reads")
+
+        report = validate_inputs({"config": path("bad_config.json"),
+                                  "penetration": path("bad_penetration.json")})
+        check(len(report["inputs"]["config"]["errors"]) == 2
+              and report["inputs"]["penetration"]["errors"] == ["non-numeric ratio for A/Solar"],
+              "malformed config sections and boolean ratios are reported, not raised")
+        report = validate_inputs({"config": path("broken.json"), "penetration": path("broken.json")})
+        check(not report["inputs"]["config"]["ok"] and not report["inputs"]["penetration"]["ok"],
+              "unparseable JSON is reported as an error entry")
+
+        report = validate_inputs({"resources": path("resources_utc.csv"),
+                                  "netload": path("netload.xlsx")})
+        check(report["ok"] and any("timezone" in w for w in report["warnings"]),
+              "timezone-aware and naive ranges are compared without raising")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
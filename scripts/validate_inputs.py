@@ -1,60 +1,45 @@
-import pandas as pd
+import argparse
 import os
-import json
+import sys
 
-def validate_queue_data(path):
-    print(f"🔍 Validating queue data at: {path}")
-    try:
-        df = pd.read_excel(path)
-        required_cols = ["QueueDate", "CODDate", "Status"]
-        for col in required_cols:
-            if col not in df.columns:
-                print(f"❌ Missing column: {col}")
-        df["QueueDate"] = pd.to_datetime(df["QueueDate"], errors="coerce")
-        df["CODDate"] = pd.to_datetime(df["CODDate"], errors="coerce")
-        print("📊 Status breakdown:\n", df["Status"].value_counts(dropna=False))
-    except Exception as e:
-        print(f"❌ Queue validation failed: {e}")
+# Allow running as `python scripts/validate_inputs.py` without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-def validate_elcc_timeseries(resource_path, netload_path):
-    print(f"🔍 Validating ELCC time series...")
-    try:
-        res = pd.read_csv(resource_path, parse_dates=["Timestamp"])
-        net = pd.read_excel(netload_path, parse_dates=["Timestamp"])
-        print(f"✅ Resource range: {res['Timestamp'].min()} → {res['Timestamp'].max()}")
-        print(f"✅ Net load range: {net['Timestamp'].min()} → {net['Timestamp'].max()}")
-    except Exception as e:
-        print(f"❌ Time series validation failed: {e}")
+from uevf.validation import validate_inputs, SAMPLE_ROWS
 
-def validate_penetration_json(path):
-    print(f"🔍 Validating penetration ratios JSON...")
-    try:
-        with open(path, 'r') as f:
-            data = json.load(f)
-        print("✅ Penetration tech types:", list(data.keys())[:5])
-    except Exception as e:
-        print(f"❌ Penetration JSON error: {e}")
+DEFAULT_PATHS = {
+    "config": "data/modeling_config.json",
+    "penetration": "data/penetration_ratios.json",
+    "resources": "data/20250728_rt_lmp_final.csv",
+    "netload": "data/EIA_930A_2023_with layout.xlsx",
+    "queue": "data/July Queue's 2025.xlsx",
+    "eue": "data/UEVF-IQ - Foundational.csv",
+}
 
-def validate_eue_csv(path):
-    print(f"🔍 Validating EUE CSV...")
-    try:
-        df = pd.read_csv(path)
-        print("✅ EUE sample:\n", df.head(2))
-    except Exception as e:
-        print(f"❌ EUE CSV error: {e}")
-
-def validate_config_json(path):
-    print(f"🔍 Validating modeling config...")
-    try:
-        with open(path, 'r') as f:
-            cfg = json.load(f)
-        print("✅ Config keys:", list(cfg.keys()))
-    except Exception as e:
-        print(f"❌ Config JSON error: {e}")
+def print_report(report):
+    for name, entry in report["inputs"].items():
+        status = "✅" if entry["ok"] else "❌"
+        print(f"{status} {name}: {entry['path']}")
+        for col, (lo, hi) in entry["ranges"].items():
+            print(f"   📅 {col}: {lo} → {hi}")
+        if entry["iso_coverage"]:
+            print(f"   🗺️  ISOs: {entry['iso_coverage']}")
+        for msg in entry["errors"]:
+            print(f"   ❌ {msg}")
+        for msg in entry["warnings"]:
+            print(f"   ⚠️  {msg}")
+    for msg in report["warnings"]:
+        print(f"⚠️  {msg}")
 
 if __name__ == "__main__":
-    validate_queue_data("data/July Queue's 2025.xlsx")
-    validate_elcc_timeseries("data/20250728_rt_lmp_final.csv", "data/EIA_930A_2023_with layout.xlsx")
-    validate_penetration_json("data/penetration_ratios.json")
-    validate_eue_csv("data/UEVF-IQ - Foundational.csv")
-    validate_config_json("data/modeling_config.json")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Fast header-and-sample validation of pipeline inputs")
+    for name, default in DEFAULT_PATHS.items():
+        parser.add_argument(f"--{name}", default=default)
+    parser.add_argument("--sample-rows", type=int, default=SAMPLE_ROWS,
+                        help="Rows sampled per table for dtype checks")
+    args = parser.parse_args()
+
+    report = validate_inputs({name: getattr(args, name) for name in DEFAULT_PATHS},
+                             sample_rows=args.sample_rows)
+    print_report(report)
+    sys.exit(0 if report["ok"] else 1)
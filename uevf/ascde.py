@@ -16,7 +16,8 @@ def compute_ascde(queue_df: pd.DataFrame,
     Parameters:
     - queue_df: DataFrame containing project data, including 'ProjectID', 'ISO', 'TechType', and 'Capacity'.
     - elcc_df: DataFrame with 'ISO', 'TechType', and 'AdjustedELCC' columns.
-    - eue_df: DataFrame with 'ProjectID' and 'EUE' columns.
+    - eue_df: DataFrame with 'ProjectID' and 'EUE' columns. If queue_df already has
+      an 'EUE' column, its values take precedence and eue_df only fills gaps.
     - voll: Value of Lost Load ($/MWh).
 
     Returns:
@@ -28,12 +29,20 @@ def compute_ascde(queue_df: pd.DataFrame,
         on=['ISO', 'TechType'],
         how='left'
     )
-    # Merge EUE values
-    merged = merged.merge(
-        eue_df[['ProjectID', 'EUE']],
-        on='ProjectID',
-        how='left'
-    )
+    # Merge EUE values, keeping any EUE already supplied with the project
+    if 'EUE' in merged.columns:
+        merged = merged.merge(
+            eue_df[['ProjectID', 'EUE']].rename(columns={'EUE': 'TableEUE'}),
+            on='ProjectID',
+            how='left'
+        )
+        merged['EUE'] = merged['EUE'].fillna(merged.pop('TableEUE'))
+    else:
+        merged = merged.merge(
+            eue_df[['ProjectID', 'EUE']],
+            on='ProjectID',
+            how='left'
+        )
     # Calculate ASCDE = EUE * VOLL / (Capacity * AdjustedELCC)
     merged['ASCDE'] = merged['EUE'] * voll / (merged['Capacity'] * merged['AdjustedELCC'])
     return merged
\ No newline at end of file
@@ -0,0 +1,410 @@
+"""
+service.py
+
+Warm, long-running localhost HTTP scoring service for the UEVF-ASCDE pipeline.
+
+Inputs (config, penetration ratios, resource profiles, net load, EUE table) are
+loaded and the baseline ELCC table is computed once. Requests are then answered
+from memory:
+
+- GET  /health  : service status and when state was last loaded
+- GET  /elcc    : the loaded penetration-adjusted ELCC table
+- POST /score   : {"projects": [...], "voll": optional} -> ASCDE scores
+- POST /whatif  : {"penetration": {ISO: {TechType: ratio}}, "voll": optional,
+                   "projects": optional} -> adjusted ELCC table and ASCDE scores
+
+Each project needs 'ProjectID', 'ISO', 'TechType' and 'Capacity'; an optional
+'EUE' value is used in preference to the loaded EUE table. ProjectIDs are
+matched as strings. Projects with no EUE, no matching ELCC row, or a
+non-finite ASCDE (zero Capacity or ELCC) are scored as null and listed under
+'warnings'.
+
+Concurrent /score requests are collected into micro-batches and scored with a
+single compute_ascde call per state snapshot and VOLL value; if a batch call
+fails, its requests are rescored one by one so only the offending request gets
+the error. Input files are polled for changes; only the parts of the state
+whose inputs changed are rebuilt, in the background, then swapped in atomically.
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from uevf.ascde import compute_ascde
+from uevf.config import load_modeling_config
+from uevf.elcc import compute_baseline_elcc, apply_penetration_decay
+from uevf.utils import load_table
+from uevf.validation import validate_inputs, stage_requirements, penetration_errors
+
+STATE_INPUTS = ("config", "penetration", "resources", "netload", "eue")
+STATE_COLUMNS = {**stage_requirements(["elcc"]), "eue": ["ProjectID", "EUE"]}
+PROJECT_COLUMNS = ["ProjectID", "ISO", "TechType", "Capacity"]
+# Columns compute_ascde adds; drop them from payloads so merges cannot clash
+RESERVED_COLUMNS = ["AdjustedELCC", "ASCDE", "_Request"]
+BATCH_WINDOW = 0.005
+RELOAD_INTERVAL = 2.0
+
+
+class ScoringState:
+    """
+    Immutable snapshot of everything needed to score projects.
+
+    Attributes:
+    - paths: dict of input name -> file path
+    - config: modeling config dict
+    - penetration: dict mapping ISO->TechType->penetration_ratio
+    - baseline_elcc: DataFrame with ['ISO', 'TechType', 'BaselineELCC']
+    - elcc: baseline_elcc with penetration decay applied ('AdjustedELCC')
+    - eue: DataFrame with 'ProjectID' and 'EUE' columns, one row per ProjectID
+    - mtimes: dict of input name -> modification time at load
+    - loaded_at: UNIX time the snapshot was built
+
+    Parameters:
+    - paths: dict of input name -> file path
+    - previous: Optional earlier snapshot; baseline ELCC and the EUE table are
+      reused from it when their inputs (and peak_percentile) are unchanged.
+    """
+
+    def __init__(self, paths: dict, previous: "ScoringState" = None):
+        self.paths = {name: paths[name] for name in STATE_INPUTS}
+        self.mtimes = _input_mtimes(self.paths)
+        changed = _changed_inputs(previous, self.mtimes)
+        self.config = load_modeling_config(self.paths["config"])
+        with open(self.paths["penetration"], 'r') as f:
+            self.penetration = json.load(f)
+
+        peak = self.config["modeling_parameters"]["peak_percentile"]
+        if ({"resources", "netload"} & changed
+                or peak != previous.config["modeling_parameters"]["peak_percentile"]):
+            res_df = load_table(self.paths["resources"], parse_dates=["Timestamp"])
+            nl_df = load_table(self.paths["netload"], parse_dates=["Timestamp"])
+            self.baseline_elcc = compute_baseline_elcc(res_df, nl_df, peak)
+        else:
+            self.baseline_elcc = previous.baseline_elcc
+        self.elcc = self.adjusted_elcc(self.penetration)
+
+        if "eue" in changed:
+            eue = load_table(self.paths["eue"])[["ProjectID", "EUE"]]
+            eue = eue.assign(ProjectID=eue["ProjectID"].astype(str))
+            self.eue = eue.drop_duplicates("ProjectID", keep="last")
+        else:
+            self.eue = previous.eue
+        self.loaded_at = time.time()
+
+    @property
+    def voll(self) -> float:
+        return self.config["modeling_parameters"]["voll"]
+
+    def adjusted_elcc(self, penetration: dict) -> pd.DataFrame:
+        """Apply penetration decay to the cached baseline ELCC table."""
+        return apply_penetration_decay(
+            self.baseline_elcc, penetration, self.config["elcc_decay_parameters"]
+        )
+
+
+def _input_mtimes(paths: dict) -> dict:
+    return {name: os.path.getmtime(path) for name, path in paths.items()}
+
+
+def _changed_inputs(previous, mtimes: dict) -> set:
+    if previous is None:
+        return set(mtimes)
+    return {name for name, mtime in mtimes.items() if previous.mtimes.get(name) != mtime}
+
+
+def _merge_penetration(base: dict, override: dict) -> dict:
+    errors = penetration_errors(override)
+    if errors:
+        raise ValueError(f"invalid 'penetration': {'; '.join(errors)}")
+    merged = copy.deepcopy(base)
+    for iso, techs in override.items():
+        merged.setdefault(iso, {}).update(techs)
+    return merged
+
+
+def _projects_frame(projects) -> pd.DataFrame:
+    if not isinstance(projects, list) or not projects:
+        raise ValueError("'projects' must be a non-empty list of objects")
+    if not all(isinstance(p, dict) for p in projects):
+        raise ValueError("'projects' must be a non-empty list of objects")
+    df = pd.DataFrame(projects)
+    missing = [c for c in PROJECT_COLUMNS if c not in df.columns]
+    if missing:
+        raise ValueError(f"projects missing fields: {missing}")
+    df = df.drop(columns=[c for c in RESERVED_COLUMNS if c in df.columns])
+    # The EUE table's ProjectIDs are held as strings; match JSON ints and strings alike
+    df["ProjectID"] = df["ProjectID"].astype(str)
+    for col in ("Capacity", "EUE"):
+        if col not in df.columns:
+            continue
+        values = pd.to_numeric(df[col], errors="coerce")
+        bad = df.loc[values.isna() & df[col].notna(), "ProjectID"].tolist()
+        if col == "Capacity":
+            bad += df.loc[df[col].isna(), "ProjectID"].tolist()
+        if bad:
+            raise ValueError(f"non-numeric {col} for projects: {bad}")
+        df[col] = values
+    return df
+
+
+def _score_warnings(scores: pd.DataFrame) -> list:
+    warnings = []
+    no_eue = scores.loc[scores["EUE"].isna(), "ProjectID"].tolist()
+    if no_eue:
+        warnings.append(f"no EUE for projects {no_eue}; send 'EUE' or add them to the EUE table")
+    no_elcc = scores.loc[scores["AdjustedELCC"].isna(), "ProjectID"].tolist()
+    if no_elcc:
+        warnings.append(f"no ELCC for the ISO/TechType of projects {no_elcc}")
+    inputs_known = scores["EUE"].notna() & scores["AdjustedELCC"].notna()
+    not_finite = scores.loc[inputs_known & ~np.isfinite(scores["ASCDE"]), "ProjectID"].tolist()
+    if not_finite:
+        warnings.append(f"ASCDE is not finite for projects {not_finite} "
+                        "(zero Capacity or AdjustedELCC); scored as null")
+    return warnings
+
+
+def _records(df: pd.DataFrame) -> list:
+    # inf (e.g. zero AdjustedELCC) and NaN are not valid JSON; send them as null
+    df = df.replace([np.inf, -np.inf], np.nan)
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+class _ScoreBatcher:
+    """
+    Collect concurrent score requests for a short window and score them together.
+    """
+
+    def __init__(self, service, window: float = BATCH_WINDOW):
+        self._service = service
+        self._window = window
+        self._pending = []
+        self._cond = threading.Condition()
+        threading.Thread(target=self._run, name="uevf-batcher", daemon=True).start()
+
+    def submit(self, projects: pd.DataFrame, voll: float = None) -> pd.DataFrame:
+        # Snapshot state once so VOLL and the ELCC/EUE tables come from the same load
+        state = self._service.state
+        item = {"projects": projects, "state": state,
+                "voll": state.voll if voll is None else voll,
+                "done": threading.Event(), "result": None, "error": None}
+        with self._cond:
+            self._pending.append(item)
+            self._cond.notify()
+        item["done"].wait()
+        if item["error"] is not None:
+            raise item["error"]
+        return item["result"]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            time.sleep(self._window)
+            with self._cond:
+                batch, self._pending = self._pending, []
+            self._score(batch)
+
+    def _score(self, batch: list):
+        groups = {}
+        for i, item in enumerate(batch):
+            groups.setdefault((item["state"], item["voll"]), []).append(i)
+        for (state, voll), indices in groups.items():
+            try:
+                frames = [batch[i]["projects"].assign(_Request=i) for i in indices]
+                scored = compute_ascde(pd.concat(frames, ignore_index=True),
+                                       state.elcc, state.eue, voll)
+                for i, part in scored.groupby("_Request", sort=False):
+                    batch[i]["result"] = part.drop(columns="_Request").reset_index(drop=True)
+            except Exception:
+                # Rescore individually so one bad request cannot fail the others
+                for i in indices:
+                    try:
+                        batch[i]["result"] = compute_ascde(batch[i]["projects"], state.elcc,
+                                                           state.eue, voll)
+                    except Exception as e:
+                        batch[i]["error"] = e
+            for i in indices:
+                batch[i]["done"].set()
+
+
+class ScoringService:
+    """
+    Holds the current ScoringState, batches score requests and hot-reloads inputs.
+
+    Parameters:
+    - paths: dict with 'config', 'penetration', 'resources', 'netload' and 'eue'
+      file paths.
+    - reload_interval: Seconds between input-file change checks (0 disables).
+    - batch_window: Seconds to wait for concurrent score requests to batch.
+    - validate: Validate inputs before the initial load; pass False when the
+      caller has already run the pre-flight check. Reloads always validate the
+      inputs that changed. Validation is threads-only here, since forking from
+      this multithreaded process could deadlock.
+    """
+
+    def __init__(self, paths: dict, reload_interval: float = RELOAD_INTERVAL,
+                 batch_window: float = BATCH_WINDOW, validate: bool = True):
+        self.paths = {name: paths[name] for name in STATE_INPUTS}
+        self.state = self._load(validate)
+        self._batcher = _ScoreBatcher(self, batch_window)
+        if reload_interval > 0:
+            threading.Thread(target=self._watch, args=(reload_interval,),
+                             name="uevf-reloader", daemon=True).start()
+
+    def _load(self, validate: bool = True, previous: ScoringState = None) -> ScoringState:
+        if validate:
+            changed = _changed_inputs(previous, _input_mtimes(self.paths))
+            report = validate_inputs({name: self.paths[name] for name in self.paths
+                                      if name in changed},
+                                     columns=STATE_COLUMNS, processes=False)
+            if not report["ok"]:
+                errors = [f"{name}: {msg}" for name, entry in report["inputs"].items()
+                          for msg in entry["errors"]]
+                raise ValueError(f"Input validation failed: {errors}")
+        start = time.time()
+        state = ScoringState(self.paths, previous)
+        logging.info("Scoring state loaded in %.2fs (%d ELCC rows, %d EUE rows)",
+                     time.time() - start, len(state.elcc), len(state.eue))
+        return state
+
+    def _watch(self, interval: float):
+        seen = self.state.mtimes
+        while True:
+            time.sleep(interval)
+            try:
+                current = _input_mtimes(self.paths)
+            except OSError as e:
+                logging.warning("Input check failed: %s", e)
+                continue
+            if current == seen:
+                continue
+            seen = current
+            changed = [name for name in current if current[name] != self.state.mtimes.get(name)]
+            logging.info("Input files changed (%s); reloading scoring state", ", ".join(changed))
+            try:
+                self.state = self._load(previous=self.state)
+            except Exception:
+                logging.error("Reload failed; keeping previous scoring state", exc_info=True)
+
+    def score(self, projects, voll: float = None) -> pd.DataFrame:
+        """Score a list of project dicts, batched with concurrent requests."""
+        df = _projects_frame(projects)
+        return self._batcher.submit(df, None if voll is None else float(voll))
+
+    def whatif(self, penetration: dict = None, voll: float = None, projects=None) -> dict:
+        """Recompute adjusted ELCC under penetration overrides and optionally score projects."""
+        state = self.state
+        elcc = state.adjusted_elcc(_merge_penetration(state.penetration,
+                                                      {} if penetration is None else penetration))
+        result = {"elcc": elcc}
+        if projects is not None:
+            result["scores"] = compute_ascde(_projects_frame(projects), elcc, state.eue,
+                                             state.voll if voll is None else float(voll))
+        return result
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def _send(self, status: int, body):
+        payload = json.dumps(body, default=str).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(body, dict):
+            raise ValueError("request body must be a JSON object")
+        return body
+
+    def do_GET(self):
+        service = self.server.service
+        if self.path == "/health":
+            state = service.state
+            self._send(200, {"status": "ok", "loaded_at": state.loaded_at,
+                             "isos": sorted(state.elcc["ISO"].astype(str).unique())})
+        elif self.path == "/elcc":
+            self._send(200, {"elcc": _records(service.state.elcc)})
+        else:
+            self._send(404, {"error": f"unknown path: {self.path}"})
+
+    def do_POST(self):
+        service = self.server.service
+        try:
+            body = self._read_json()
+            if self.path == "/score":
+                scores = service.score(body.get("projects"), body.get("voll"))
+                self._send(200, {"scores": _records(scores),
+                                 "warnings": _score_warnings(scores)})
+            elif self.path == "/whatif":
+                result = service.whatif(body.get("penetration"), body.get("voll"),
+                                        body.get("projects"))
+                response = {key: _records(df) for key, df in result.items()}
+                if "scores" in result:
+                    response["warnings"] = _score_warnings(result["scores"])
+                self._send(200, response)
+            else:
+                self._send(404, {"error": f"unknown path: {self.path}"})
+        except (ValueError, TypeError, KeyError) as e:
+            self._send(400, {"error": str(e)})
+        except Exception as e:
+            logging.error("Request to %s failed", self.path, exc_info=True)
+            self._send(500, {"error": str(e)})
+
+    def log_message(self, format, *args):
+        logging.debug("%s - %s", self.address_string(), format % args)
+
+
+def make_server(paths: dict, host: str = "127.0.0.1", port: int = 8765,
+                reload_interval: float = RELOAD_INTERVAL,
+                validate: bool = True) -> ThreadingHTTPServer:
+    """
+    Load scoring state and bind an HTTP server to it without starting the loop.
+
+    Parameters:
+    - paths: dict with 'config', 'penetration', 'resources', 'netload' and 'eue'
+      file paths.
+    - host: Interface to bind (localhost by default).
+    - port: TCP port to listen on (0 picks a free port).
+    - reload_interval: Seconds between input-file change checks (0 disables).
+    - validate: Validate inputs before the initial load.
+
+    Returns:
+    - ThreadingHTTPServer with the ScoringService attached as `server.service`.
+    """
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    try:
+        server.service = ScoringService(paths, reload_interval, validate=validate)
+    except Exception:
+        server.server_close()
+        raise
+    return server
+
+
+def serve(paths: dict, host: str = "127.0.0.1", port: int = 8765,
+          reload_interval: float = RELOAD_INTERVAL, validate: bool = True):
+    """
+    Load scoring state once and serve requests until interrupted.
+
+    Parameters: see make_server.
+    """
+    server = make_server(paths, host, port, reload_interval, validate)
+    logging.info("UEVF scoring service listening on http://%s:%d", *server.server_address[:2])
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Shutting down scoring service")
+    finally:
+        server.server_close()
@@ -22,6 +22,27 @@ def load_csv(path: str, parse_dates=None) -> pd.DataFrame:
     """
     return pd.read_csv(path, parse_dates=parse_dates)
 
+def is_excel(path: str) -> bool:
+    """
+    Return True if the path has an Excel workbook extension (.xlsx or .xls).
+    """
+    return os.path.splitext(path)[1].lower() in (".xlsx", ".xls")
+
+def load_table(path: str, parse_dates=None) -> pd.DataFrame:
+    """
+    Load a CSV or Excel input into a pandas DataFrame, dispatching on extension.
+    
+    Parameters:
+    - path: Path to the CSV or Excel file.
+    - parse_dates: List of column names to parse as dates.
+    
+    Returns:
+    - DataFrame containing the table data.
+    """
+    if is_excel(path):
+        return pd.read_excel(path, parse_dates=parse_dates)
+    return load_csv(path, parse_dates=parse_dates)
+
 def save_dataframe(df: pd.DataFrame, path: str):
     """
     Save a pandas DataFrame to CSV, creating directories if needed.
@@ -0,0 +1,420 @@
+"""
+validation.py
+
+Fast pre-flight validation of UEVF-ASCDE pipeline inputs.
+
+Schema and dtype checks run against the header and a small sample of rows.
+Timestamp ranges and ISO coverage are computed by streaming only the columns
+they need: CSV inputs in pandas chunks, Excel inputs row by row through an
+openpyxl read-only worksheet. All inputs are validated concurrently; Excel
+inputs run in worker processes because openpyxl parsing holds the GIL.
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+from uevf.utils import is_excel
+
+SAMPLE_ROWS = 500
+CHUNK_SIZE = 200_000
+
+# Column expectations per tabular input, mirroring what each pipeline stage reads.
+INPUT_SCHEMAS = {
+    "resources": {
+        "required": ["Timestamp", "ISO", "TechType", "CapacityFactor"],
+        "dates": ["Timestamp"],
+        "numeric": ["CapacityFactor"],
+    },
+    "netload": {
+        "required": ["Timestamp", "ISO", "NetLoad"],
+        "dates": ["Timestamp"],
+        "numeric": ["NetLoad"],
+    },
+    "queue": {
+        "required": ["ProjectID", "ISO", "TechType", "QueueDate", "CODDate", "Status", "Capacity"],
+        "dates": ["QueueDate", "CODDate"],
+        "numeric": ["Capacity"],
+    },
+    "eue": {
+        "required": ["ProjectID", "EUE"],
+        "dates": [],
+        "numeric": ["EUE"],
+    },
+}
+
+# Columns each pipeline stage actually reads; the JSON inputs are read by every stage.
+STAGE_COLUMNS = {
+    "elcc": {
+        "resources": ["Timestamp", "ISO", "TechType", "CapacityFactor"],
+        "netload": ["Timestamp", "ISO", "NetLoad"],
+    },
+    "survival": {
+        "queue": ["ISO", "QueueDate", "CODDate", "Status"],
+    },
+    "ascde": {
+        "queue": ["ProjectID", "ISO", "TechType", "Capacity"],
+        "eue": ["ProjectID", "EUE"],
+    },
+}
+
+CONFIG_SECTIONS = {
+    "modeling_parameters": ["peak_percentile", "voll"],
+    "elcc_decay_parameters": [],
+}
+
+
+def _new_entry(path: str) -> dict:
+    return {
+        "path": path,
+        "ok": True,
+        "errors": [],
+        "warnings": [],
+        "columns": [],
+        "ranges": {},
+        "iso_coverage": [],
+    }
+
+
+def _fail(entry: dict, message: str):
+    entry["ok"] = False
+    entry["errors"].append(message)
+
+
+def _iter_excel_chunks(path: str, usecols: list, chunksize: int):
+    """
+    Yield DataFrames of `usecols` from the first worksheet, `chunksize` rows at a time.
+
+    The workbook is opened read-only so rows are parsed lazily and only the values
+    in the needed columns are kept.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        # Many exporters write a wrong <dimension> tag; ignore it as pandas does
+        ws.reset_dimensions()
+        rows = ws.iter_rows(values_only=True)
+        header = [str(h) if h is not None else None for h in next(rows, ())]
+        positions = [header.index(col) for col in usecols]
+        buffer = []
+        for row in rows:
+            buffer.append([row[i] if i < len(row) else None for i in positions])
+            if len(buffer) >= chunksize:
+                yield pd.DataFrame(buffer, columns=usecols)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=usecols)
+    finally:
+        wb.close()
+
+
+def read_sample(path: str, nrows: int = SAMPLE_ROWS) -> pd.DataFrame:
+    """
+    Read the header and the first `nrows` rows of a CSV or Excel input.
+
+    Parameters:
+    - path: Path to the CSV or Excel file.
+    - nrows: Number of data rows to read after the header.
+
+    Returns:
+    - DataFrame holding the sampled rows.
+    """
+    if is_excel(path):
+        return pd.read_excel(path, nrows=nrows)
+    return pd.read_csv(path, nrows=nrows)
+
+
+def scan_columns(path: str, date_cols: list, iso_col: str = "ISO",
+                 chunksize: int = CHUNK_SIZE) -> tuple:
+    """
+    Compute min/max for date columns and the set of ISOs, reading only those columns.
+
+    CSV inputs are streamed in pandas chunks; Excel inputs are streamed row by row
+    from a read-only openpyxl worksheet. openpyxl still has to parse each row's XML,
+    but no cell objects or full-width DataFrame are built. Legacy .xls workbooks,
+    which openpyxl cannot open, fall back to `pd.read_excel(usecols=...)`.
+
+    Parameters:
+    - path: Path to the CSV or Excel file.
+    - date_cols: Column names to parse as dates and range.
+    - iso_col: Column holding the ISO label, or None to skip coverage.
+    - chunksize: Rows per chunk when streaming.
+
+    Returns:
+    - (ranges, isos, unparsed) where ranges maps column -> (min, max) Timestamps,
+      isos is a sorted list of ISO labels, and unparsed maps column -> count of
+      non-empty values that failed to parse as dates.
+    """
+    usecols = list(date_cols) + ([iso_col] if iso_col else [])
+    if path.lower().endswith(".xls"):
+        chunks = [pd.read_excel(path, usecols=usecols)]
+    elif is_excel(path):
+        chunks = _iter_excel_chunks(path, usecols, chunksize)
+    else:
+        chunks = pd.read_csv(path, usecols=usecols, chunksize=chunksize)
+
+    mins, maxs = {}, {}
+    unparsed = {col: 0 for col in date_cols}
+    isos = set()
+    for chunk in chunks:
+        for col in date_cols:
+            parsed = pd.to_datetime(chunk[col], errors="coerce")
+            unparsed[col] += int((parsed.isna() & chunk[col].notna()).sum())
+            lo, hi = parsed.min(), parsed.max()
+            if pd.notna(lo):
+                mins[col] = lo if col not in mins else min(mins[col], lo)
+                maxs[col] = hi if col not in maxs else max(maxs[col], hi)
+        if iso_col:
+            isos.update(chunk[iso_col].dropna().astype(str).unique())
+
+    ranges = {col: (mins.get(col), maxs.get(col)) for col in date_cols}
+    return ranges, sorted(isos), unparsed
+
+
+def stage_requirements(stages: list) -> dict:
+    """
+    Return the inputs, and the table columns, that the given pipeline stages read.
+
+    Parameters:
+    - stages: Stage names from STAGE_COLUMNS (e.g. ['elcc'] or all three for 'full').
+
+    Returns:
+    - dict of input name -> list of required columns, or None for JSON inputs.
+    """
+    required = {"config": None, "penetration": None}
+    for stage in stages:
+        for name, cols in STAGE_COLUMNS[stage].items():
+            merged = required.setdefault(name, [])
+            merged.extend(c for c in cols if c not in merged)
+    return required
+
+
+def validate_table(name: str, path: str, sample_rows: int = SAMPLE_ROWS,
+                   required: list = None) -> dict:
+    """
+    Validate one tabular input against its entry in INPUT_SCHEMAS.
+
+    Parameters:
+    - name: Key into INPUT_SCHEMAS (e.g. 'resources', 'queue').
+    - path: Path to the CSV or Excel file.
+    - sample_rows: Number of rows sampled for dtype checks.
+    - required: Columns to require instead of the schema's full list; date and
+      numeric checks are limited to these columns.
+
+    Returns:
+    - Report entry dict with 'path', 'ok', 'errors', 'warnings', 'columns',
+      'ranges' and 'iso_coverage'.
+    """
+    schema = INPUT_SCHEMAS[name]
+    required = required or schema["required"]
+    entry = _new_entry(path)
+    try:
+        sample = read_sample(path, sample_rows)
+    except Exception as e:
+        _fail(entry, f"could not read: {e}")
+        return entry
+
+    entry["columns"] = [str(c) for c in sample.columns]
+    missing = [c for c in required if c not in sample.columns]
+    for col in missing:
+        _fail(entry, f"missing column: {col}")
+
+    for col in schema["numeric"]:
+        if col not in required or col in missing:
+            continue
+        values = sample[col].dropna()
+        if not values.empty and pd.to_numeric(values, errors="coerce").isna().all():
+            _fail(entry, f"column {col} is not numeric in sampled rows")
+
+    date_cols = [c for c in schema["dates"] if c in required and c not in missing]
+    iso_col = "ISO" if "ISO" in sample.columns else None
+    if not date_cols and not iso_col:
+        return entry
+
+    try:
+        ranges, isos, unparsed = scan_columns(path, date_cols, iso_col)
+    except Exception as e:
+        _fail(entry, f"column scan failed: {e}")
+        return entry
+
+    entry["ranges"] = ranges
+    entry["iso_coverage"] = isos
+    for col in date_cols:
+        if ranges[col][0] is None:
+            _fail(entry, f"column {col} has no parseable dates")
+        elif unparsed[col]:
+            entry["warnings"].append(f"column {col} has {unparsed[col]} unparseable dates")
+    return entry
+
+
+def validate_config(path: str) -> dict:
+    """
+    Validate that the modeling config holds the sections and keys the pipeline reads.
+
+    Parameters:
+    - path: Path to modeling_config.json.
+
+    Returns:
+    - Report entry dict (see validate_table); 'columns' lists top-level keys.
+    """
+    entry = _new_entry(path)
+    try:
+        with open(path, 'r') as f:
+            cfg = json.load(f)
+    except Exception as e:
+        _fail(entry, f"could not read: {e}")
+        return entry
+    if not isinstance(cfg, dict):
+        _fail(entry, "config must be a JSON object")
+        return entry
+
+    entry["columns"] = list(cfg.keys())
+    for section, keys in CONFIG_SECTIONS.items():
+        if section not in cfg:
+            _fail(entry, f"missing section: {section}")
+            continue
+        if not isinstance(cfg[section], dict):
+            _fail(entry, f"section {section} must be a JSON object")
+            continue
+        for key in keys:
+            if key not in cfg[section]:
+                _fail(entry, f"missing key: {section}.{key}")
+    return entry
+
+
+def penetration_errors(data) -> list:
+    """
+    Check the ISO -> {TechType: ratio} shape of penetration ratios.
+
+    Parameters:
+    - data: Parsed penetration ratios (from the JSON file or a request body).
+
+    Returns:
+    - List of error messages; empty when the shape is valid.
+    """
+    if not isinstance(data, dict):
+        return ["penetration ratios must be an object of ISO -> {TechType: ratio}"]
+    errors = []
+    for iso, techs in data.items():
+        if not isinstance(techs, dict):
+            errors.append(f"ISO {iso} must map TechType -> ratio")
+            continue
+        for tech, ratio in techs.items():
+            if isinstance(ratio, bool) or not isinstance(ratio, (int, float)):
+                errors.append(f"non-numeric ratio for {iso}/{tech}")
+    return errors
+
+
+def validate_penetration(path: str) -> dict:
+    """
+    Validate the penetration ratios JSON (ISO -> TechType -> ratio).
+
+    Parameters:
+    - path: Path to penetration_ratios.json.
+
+    Returns:
+    - Report entry dict (see validate_table); 'iso_coverage' lists ISO keys.
+    """
+    entry = _new_entry(path)
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except Exception as e:
+        _fail(entry, f"could not read: {e}")
+        return entry
+    for msg in penetration_errors(data):
+        _fail(entry, msg)
+    if isinstance(data, dict):
+        entry["iso_coverage"] = sorted(str(k) for k in data)
+    return entry
+
+
+def _as_utc_naive(ts: pd.Timestamp) -> pd.Timestamp:
+    return ts.tz_convert(None) if ts.tzinfo is not None else ts
+
+
+def validate_inputs(paths: dict, sample_rows: int = SAMPLE_ROWS, max_workers: int = None,
+                    columns: dict = None, processes: bool = True) -> dict:
+    """
+    Validate all pipeline inputs concurrently and return a structured report.
+
+    Parameters:
+    - paths: dict with any of the keys 'config', 'penetration', 'resources',
+      'netload', 'queue' and 'eue' mapped to file paths.
+    - sample_rows: Number of rows sampled per table for dtype checks.
+    - max_workers: Pool size for each of the thread and process pools (defaults
+      to one worker per input). Excel tables are validated in a process pool,
+      since openpyxl parsing is pure Python and would serialize on the GIL;
+      everything else runs in a thread pool.
+    - columns: Optional dict of input name -> required columns (see
+      stage_requirements) overriding the full INPUT_SCHEMAS lists.
+    - processes: Allow the Excel process pool. Pass False from multithreaded
+      callers (e.g. the scoring service), where forking could deadlock on
+      locks held by other threads; all inputs then run on the thread pool.
+
+    Returns:
+    - dict with 'ok' (bool), 'inputs' (name -> report entry) and 'warnings'
+      (cross-input checks such as ISO coverage mismatches).
+    """
+    jobs = {}
+    for name, path in paths.items():
+        if name in INPUT_SCHEMAS:
+            jobs[name] = (validate_table, (name, path, sample_rows, (columns or {}).get(name)))
+        elif name == "config":
+            jobs[name] = (validate_config, (path,))
+        elif name == "penetration":
+            jobs[name] = (validate_penetration, (path,))
+        else:
+            raise ValueError(f"Unknown input: {name}")
+
+    inputs = {}
+    missing = {name for name, path in paths.items() if not os.path.exists(path)}
+    for name in missing:
+        inputs[name] = _new_entry(paths[name])
+        _fail(inputs[name], "file not found")
+
+    pending = {name: job for name, job in jobs.items() if name not in missing}
+    excel = {name: job for name, job in pending.items()
+             if name in INPUT_SCHEMAS and is_excel(paths[name])}
+    threaded = {name: job for name, job in pending.items() if name not in excel}
+
+    # A single workbook gains nothing from a separate process
+    if len(excel) < 2 or not processes:
+        threaded.update(excel)
+        excel = {}
+
+    futures = {}
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(threaded), 1)) as threads, \
+            ProcessPoolExecutor(max_workers=max_workers or max(len(excel), 1)) as processes:
+        for name, (func, args) in excel.items():
+            futures[name] = processes.submit(func, *args)
+        for name, (func, args) in threaded.items():
+            futures[name] = threads.submit(func, *args)
+        for name, future in futures.items():
+            inputs[name] = future.result()
+
+    warnings = []
+    res, nl = inputs.get("resources"), inputs.get("netload")
+    if res and nl and res["ok"] and nl["ok"]:
+        uncovered = sorted(set(nl["iso_coverage"]) - set(res["iso_coverage"]))
+        if uncovered:
+            warnings.append(f"ISOs in net load without resource profiles: {uncovered}")
+        res_range, nl_range = res["ranges"].get("Timestamp"), nl["ranges"].get("Timestamp")
+        if res_range and nl_range:
+            if (res_range[0].tzinfo is None) != (nl_range[0].tzinfo is None):
+                warnings.append("resource and net load timestamps mix timezone-aware and naive "
+                                "values; naive values were compared as UTC")
+            res_lo, res_hi = (_as_utc_naive(ts) for ts in res_range)
+            nl_lo, nl_hi = (_as_utc_naive(ts) for ts in nl_range)
+            if res_hi < nl_lo or nl_hi < res_lo:
+                warnings.append("resource and net load timestamp ranges do not overlap")
+
+    return {
+        "ok": all(entry["ok"] for entry in inputs.values()),
+        "inputs": {name: inputs[name] for name in paths},
+        "warnings": warnings,
+    }